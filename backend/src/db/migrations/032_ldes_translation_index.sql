@@ -0,0 +1,7 @@
+-- Migration: Index translations by status and event timestamp
+-- Lets the LDES export (backend/src/services/ldes.py) find approved translations
+-- in event order without a full sort; the expression must match the query's
+-- datetime(COALESCE(updated_at, modified_at, created_at))
+
+CREATE INDEX IF NOT EXISTS idx_translations_status_event
+    ON translations(status, datetime(COALESCE(updated_at, modified_at, created_at)));
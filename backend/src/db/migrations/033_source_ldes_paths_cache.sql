@@ -0,0 +1,13 @@
+-- Migration: Add source_ldes_paths table
+-- Caches the ldes:timestampPath and ldes:versionOfPath resolved from an LDES
+-- source's feed (with the source_path they were read from), so LDES
+-- generation does not have to fetch and parse the upstream feed on every run.
+-- Kept apart from sources so the sources API does not serialize it
+
+CREATE TABLE IF NOT EXISTS source_ldes_paths (
+    source_id      INTEGER PRIMARY KEY REFERENCES sources(source_id) ON DELETE CASCADE,
+    source_path    TEXT NOT NULL,  -- Feed URI the paths were read from
+    timestamp_path TEXT,  -- ldes:timestampPath, NULL if the feed declares none
+    versionof_path TEXT,  -- ldes:versionOfPath, NULL if the feed declares none
+    resolved_at    REAL NOT NULL  -- Unix time the feed was read
+);
@@ -82,6 +82,7 @@ CREATE INDEX idx_translations_status ON translations(status);
 CREATE INDEX idx_translations_lang   ON translations(language);
 CREATE INDEX idx_translations_concept_status_lang ON translations(term_field_id, status, language);
 CREATE INDEX idx_translations_source ON translations(source);
+CREATE INDEX idx_translations_status_event ON translations(status, datetime(COALESCE(updated_at, modified_at, created_at)));
 CREATE INDEX idx_appeals_status     ON appeals(status);
 CREATE INDEX idx_term_fields_term_id ON term_fields(term_id);
 CREATE INDEX idx_terms_source_id ON terms(source_id);
@@ -177,6 +178,15 @@ CREATE INDEX idx_sources_path ON sources(source_path);
 CREATE INDEX idx_sources_graph ON sources(graph_name);
 CREATE INDEX idx_sources_type ON sources(source_type);
 
+-- LDES paths cached from an LDES source's upstream feed
+CREATE TABLE source_ldes_paths (
+    source_id      INTEGER PRIMARY KEY REFERENCES sources(source_id) ON DELETE CASCADE,
+    source_path    TEXT NOT NULL,  -- Feed URI the paths were read from
+    timestamp_path TEXT,  -- ldes:timestampPath, NULL if the feed declares none
+    versionof_path TEXT,  -- ldes:versionOfPath, NULL if the feed declares none
+    resolved_at    REAL NOT NULL  -- Unix time the feed was read
+);
+
 -- Tasks table
 CREATE TABLE tasks (
     task_id     INTEGER PRIMARY KEY AUTOINCREMENT,
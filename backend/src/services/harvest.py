@@ -8,12 +8,53 @@ import sys
 import sqlite3
 import os
 import re
-import time
-from urllib.error import HTTPError
-from SPARQLWrapper import SPARQLWrapper, JSON
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import groupby
+import ijson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 SPARQL_ENDPOINT = "http://vocab.nerc.ac.uk/sparql/"
 
+# (connect, read) timeouts in seconds for SPARQL requests
+SPARQL_TIMEOUT = (10, 120)
+
+# Maximum number of bound parameters per IN (...) clause, kept well below
+# SQLite's SQLITE_MAX_VARIABLE_NUMBER on older builds (999)
+SQL_IN_CHUNK_SIZE = 500
+
+# Size of the per-connection sqlite3 prepared statement cache
+SQL_STATEMENT_CACHE_SIZE = 256
+
+# SQL statements used by insert_results. They are module constants so every
+# batch reuses the exact same strings and hits the statement cache; IN (...)
+# lists are filled in by in_clause_sql, and all full chunks share one length
+SQL_SELECT_TERM_IDS = "SELECT uri, id FROM terms WHERE uri IN ({placeholders})"
+SQL_TOUCH_TERMS = "UPDATE terms SET updated_at = CURRENT_TIMESTAMP WHERE id IN ({placeholders})"
+SQL_INSERT_TERM = "INSERT OR IGNORE INTO terms (uri) VALUES (?)"
+SQL_INSERT_TERMS_RETURNING = (
+    "INSERT OR IGNORE INTO terms (uri) VALUES {placeholders} RETURNING uri, id"
+)
+SQL_SELECT_TERM_FIELD_IDS = (
+    "SELECT term_id, field_uri, id FROM term_fields WHERE term_id IN ({placeholders})"
+)
+SQL_INSERT_TERM_FIELD = (
+    "INSERT OR IGNORE INTO term_fields (term_id, field_uri, original_value) "
+    "VALUES (?, ?, ?)"
+)
+SQL_INSERT_ORIGINAL_TRANSLATION = (
+    "INSERT OR IGNORE INTO translations (term_field_id, language, value, status, source) "
+    "VALUES (?, ?, ?, 'original', 'rdf-ingest')"
+)
+
+# INSERT ... RETURNING is available from SQLite 3.35 onwards
+SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Transient gateway errors from the SPARQL endpoint that are retried
+SPARQL_RETRY_STATUSES = (502, 503, 504)
+
 # Field mappings: SPARQL variable name -> field_uri
 FIELD_MAPPINGS = {
     "prefLabel": "http://www.w3.org/2004/02/skos/core#prefLabel",
@@ -25,6 +66,50 @@ FIELD_MAPPINGS = {
     "related": "http://www.w3.org/2004/02/skos/core#related",
 }
 
+# Harvested property URIs (a property's field_uri is the property URI itself)
+_ALLOWED_FIELD_URIS = frozenset(FIELD_MAPPINGS.values())
+
+# Harvested properties as a SPARQL VALUES list
+_PROPERTY_VALUES = " ".join(f"<{uri}>" for uri in FIELD_MAPPINGS.values())
+
+# Batch query template; create_sparql_query only fills in the collection,
+# keyset filter and limit
+# Note: We don't use SELECT DISTINCT here because we want ALL language variants
+# This means we'll get multiple rows per concept if there are multiple languages
+# Concepts are ordered by STR(?concept), the same string order the keyset
+# FILTER compares with, and the properties are OPTIONAL so every concept of the
+# page comes back (with an unbound ?property if it has none) to advance the cursor
+_QUERY_TEMPLATE = """
+    PREFIX skos: <http://www.w3.org/2004/02/skos/core#>
+    PREFIX dc: <http://purl.org/dc/terms/>
+    PREFIX owl: <http://www.w3.org/2002/07/owl#>
+    
+    SELECT ?concept ?property ?value
+    WHERE {{
+        {{
+            SELECT ?concept
+            WHERE {{
+                <{uri}> skos:member ?concept .
+                {member_filter}
+            }}
+            ORDER BY STR(?concept)
+            {limit_clause}
+        }}
+        OPTIONAL {{
+            VALUES ?property {{ {properties} }}
+            ?concept ?property ?value .
+        }}
+    }}
+    ORDER BY STR(?concept) ?property
+    """
+
+# Collection URI validation: http(s) scheme and none of the characters that
+# could break out of a SPARQL IRI, checked in a single pass
+_URI_VALID = re.compile(r"https?://[^<>\"'{}|\\^`\[\]]*")
+
+# Non-NERC collection URIs already warned about
+_warned_uris = set()
+
 
 def validate_collection_uri(uri):
     """
@@ -39,25 +124,57 @@ def validate_collection_uri(uri):
     Raises:
         ValueError: If URI is invalid
     """
-    # Basic URI validation - must start with http:// or https://
-    if not re.match(r"^https?://", uri):
-        raise ValueError(
-            f"Invalid collection URI: {uri}. Must start with http:// or https://"
-        )
-    
-    # Prevent SPARQL injection by disallowing angle brackets and special characters
-    if re.search(r"[<>\"'{}|\\^`\[\\\]]", uri):
+    # Must start with http:// or https:// and, to prevent SPARQL injection,
+    # contain no angle brackets or other special characters
+    if not _URI_VALID.fullmatch(uri):
+        if not uri.startswith(("http://", "https://")):
+            raise ValueError(
+                f"Invalid collection URI: {uri}. Must start with http:// or https://"
+            )
         raise ValueError(
             f"Invalid collection URI: {uri}. Contains prohibited characters."
         )
 
-    # Additional validation: should contain vocab.nerc.ac.uk for this specific endpoint
-    if "vocab.nerc.ac.uk" not in uri:
+    # Additional validation: should contain vocab.nerc.ac.uk for this specific endpoint.
+    # The URI is revalidated for every batch query, so only warn once
+    if "vocab.nerc.ac.uk" not in uri and uri not in _warned_uris:
+        _warned_uris.add(uri)
         print(f"Warning: Collection URI does not contain 'vocab.nerc.ac.uk': {uri}")
 
     return True
 
 
+def chunked(items, size=SQL_IN_CHUNK_SIZE):
+    """
+    Split a list into consecutive chunks of at most `size` items.
+
+    Args:
+        items: List to split
+        size: Maximum chunk length
+
+    Yields:
+        list: Consecutive slices of `items`
+    """
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+@lru_cache(maxsize=None)
+def in_clause_sql(template, count, placeholder="?"):
+    """
+    Fill the IN (...) list of an SQL template with `count` placeholders.
+
+    Args:
+        template: SQL string with a `{placeholders}` field
+        count: Number of bound parameters
+        placeholder: Text repeated per parameter (e.g. "(?)" for VALUES rows)
+
+    Returns:
+        str: SQL statement
+    """
+    return template.format(placeholders=",".join([placeholder] * count))
+
+
 def escape_sparql_uri(uri):
     """
     Escape a URI for safe use in SPARQL queries.
@@ -75,15 +192,34 @@ def escape_sparql_uri(uri):
     return uri
 
 
-def create_sparql_query(collection_uri, limit=None, offset=None):
+def escape_sparql_string(value):
+    """
+    Escape a value for use inside a double-quoted SPARQL string literal.
+
+    Args:
+        value: String to escape
+
+    Returns:
+        str: Escaped string
+    """
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def create_sparql_query(collection_uri, limit=None, after_uri=None):
     """
     Create SPARQL query to fetch all concepts from a collection.
     Fetches ALL language variants for each property (prefLabel, altLabel, definition).
 
+    Batches are paginated over concepts with a keyset cursor on the concept URI
+    rather than LIMIT/OFFSET over rows: the endpoint does a range scan instead of
+    re-skipping all previous rows, and a concept's rows are never split across
+    two batches.
+
     Args:
         collection_uri: URI of the collection to query (will be validated)
-        limit: Optional LIMIT for batching
-        offset: Optional OFFSET for batching
+        limit: Optional maximum number of concepts per batch
+        after_uri: Optional keyset cursor; only concepts whose URI sorts after
+            it are returned
 
     Returns:
         SPARQL query string
@@ -91,108 +227,211 @@ def create_sparql_query(collection_uri, limit=None, offset=None):
     # Validate and escape URI before using in query
     safe_uri = escape_sparql_uri(collection_uri)
 
-    # Note: We don't use SELECT DISTINCT here because we want ALL language variants
-    # This means we'll get multiple rows per concept if there are multiple languages
-    query = f"""
-    PREFIX skos: <http://www.w3.org/2004/02/skos/core#>
-    PREFIX dc: <http://purl.org/dc/terms/>
-    PREFIX owl: <http://www.w3.org/2002/07/owl#>
-    
-    SELECT ?concept ?property ?value
-    WHERE {{
-        <{safe_uri}> skos:member ?concept .
-        ?concept ?property ?value .
-        FILTER (?property IN (skos:prefLabel, skos:altLabel, skos:definition, skos:notation, skos:broader, skos:narrower, skos:related))
-    }}
-    ORDER BY ?concept ?property
+    member_filter = ""
+    if after_uri is not None:
+        member_filter = f'FILTER (STR(?concept) > "{escape_sparql_string(after_uri)}")'
+    limit_clause = f"LIMIT {int(limit)}" if limit is not None else ""
+
+    return _QUERY_TEMPLATE.format(
+        uri=safe_uri,
+        member_filter=member_filter,
+        limit_clause=limit_clause,
+        properties=_PROPERTY_VALUES,
+    )
+
+
+def create_sparql_session(max_retries=3, base_delay=1):
     """
-    if limit is not None:
-        query += f"\nLIMIT {limit}"
-    if offset is not None:
-        query += f"\nOFFSET {offset}"
-    return query
+    Create an HTTP session for the SPARQL endpoint.
+
+    The session keeps connections alive across batches, requests gzip-compressed
+    JSON results and retries transient gateway errors (502/503/504) with
+    exponential backoff, honouring Retry-After headers.
 
+    Args:
+        max_retries: Maximum number of retry attempts (default: 3)
+        base_delay: Base delay in seconds for exponential backoff (default: 1)
 
-def get_member_count(collection_uri):
+    Returns:
+        requests.Session: Configured session
     """
-    Query SPARQL endpoint to get the count of members in the collection.
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=base_delay,
+        status_forcelist=SPARQL_RETRY_STATUSES,
+        allowed_methods=frozenset({"GET", "POST"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(max_retries=retry)
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({
+        "Accept": "application/sparql-results+json",
+        "Accept-Encoding": "gzip, deflate",
+    })
+    return session
+
+
+SESSION = create_sparql_session()
+
+
+def stream_sparql_bindings(query):
     """
-    safe_uri = escape_sparql_uri(collection_uri)
-    query = f"""
-    PREFIX skos: <http://www.w3.org/2004/02/skos/core#>
-    SELECT (COUNT(DISTINCT ?concept) AS ?count)
-    WHERE {{
-        <{safe_uri}> skos:member ?concept .
-    }}
+    POST a query to the SPARQL endpoint and stream its result bindings.
+
+    The request is sent (and its status checked) immediately, but the JSON
+    body is parsed incrementally with ijson while it is consumed, so a batch
+    is never materialized as one large document in memory.
+
+    Args:
+        query: SPARQL query string
+
+    Returns:
+        Iterator over the `results.bindings` items
+
+    Raises:
+        requests.RequestException: If the request fails after all retries
     """
-    sparql = SPARQLWrapper(SPARQL_ENDPOINT)
-    sparql.setQuery(query)
-    sparql.setReturnFormat(JSON)
+    response = SESSION.post(
+        SPARQL_ENDPOINT, data={"query": query}, timeout=SPARQL_TIMEOUT, stream=True
+    )
     try:
-        results = sparql.query().convert()
-        bindings = results.get("results", {}).get("bindings", [])
-        if bindings and "count" in bindings[0]:
-            return int(bindings[0]["count"]["value"])
-        else:
-            raise Exception("Could not retrieve member count from SPARQL endpoint.")
-    except Exception as e:
-        raise Exception(f"SPARQL count query failed: {str(e)}")
+        response.raise_for_status()
+    except requests.RequestException:
+        response.close()
+        raise
+    # Let urllib3 undo the gzip/deflate transfer encoding for ijson
+    response.raw.decode_content = True
+    return iter_response_bindings(response)
+
 
+def iter_response_bindings(response):
+    """
+    Yield the bindings of a streamed SPARQL JSON response, then release it.
+
+    Args:
+        response: Streamed requests.Response
 
-def query_sparql_endpoint(
-    collection_uri, limit=None, offset=None, max_retries=3, base_delay=1
-):
+    Yields:
+        dict: One SPARQL result binding
+    """
+    with response:
+        yield from ijson.items(response.raw, "results.bindings.item")
+
+
+def query_sparql_endpoint(collection_uri, limit=None, after_uri=None):
     """
     Query the SPARQL endpoint for collection data.
 
-    Includes retry logic with exponential backoff for transient errors
-    such as HTTP 502 Proxy Errors.
+    Transient errors such as HTTP 502 Proxy Errors are retried with
+    exponential backoff by the shared SPARQL session.
 
     Args:
         collection_uri: URI of the collection to query
-        limit: Optional LIMIT for batching
-        offset: Optional OFFSET for batching
-        max_retries: Maximum number of retry attempts (default: 3)
-        base_delay: Base delay in seconds for exponential backoff (default: 1)
+        limit: Optional maximum number of concepts per batch
+        after_uri: Optional keyset cursor (last concept URI of the previous batch)
 
     Returns:
-        Query results as JSON
+        Iterator over the result bindings, parsed as they are streamed
 
     Raises:
         Exception: If SPARQL query fails after all retries
     """
-    sparql = SPARQLWrapper(SPARQL_ENDPOINT)
-    sparql.setQuery(create_sparql_query(collection_uri, limit=limit, offset=offset))
-    sparql.setReturnFormat(JSON)
+    query = create_sparql_query(collection_uri, limit=limit, after_uri=after_uri)
     print(
-        f"Querying SPARQL endpoint for collection: {collection_uri} LIMIT={limit} OFFSET={offset}"
+        f"Querying SPARQL endpoint for collection: {collection_uri} LIMIT={limit} AFTER={after_uri}"
     )
-    for attempt in range(max_retries):
-        try:
-            results = sparql.query().convert()
-            return results
-        except HTTPError as e:
-            if e.code == 502 and attempt < max_retries - 1:
-                delay = base_delay * (2**attempt)  # Exponential backoff
-                print(
-                    f"502 Proxy Error on attempt {attempt + 1}. Retrying in {delay}s..."
-                )
-                time.sleep(delay)
-                continue
-            raise Exception(f"SPARQL query failed: {str(e)}") from e
-        except Exception as e:
-            raise Exception(f"SPARQL query failed: {str(e)}") from e
+    try:
+        return stream_sparql_bindings(query)
+    except Exception as e:
+        raise Exception(f"SPARQL query failed: {str(e)}") from e
 
 
-def insert_results(conn, collection_uri, results):
+def fetch_term_field_ids(cursor, term_ids):
     """
-    Insert or update query results into the SQLite database.
-    
-    Processes ALL language variants from RDF data.
+    Look up the term_fields of the given terms.
+
+    Args:
+        cursor: Database cursor
+        term_ids: List of term IDs
+
+    Returns:
+        dict: (term_id, field_uri) -> term_field_id
+    """
+    term_field_map = {}
+    for chunk in chunked(term_ids):
+        cursor.execute(in_clause_sql(SQL_SELECT_TERM_FIELD_IDS, len(chunk)), chunk)
+        for term_id, field_uri, term_field_id in cursor.fetchall():
+            term_field_map[(term_id, field_uri)] = term_field_id
+    return term_field_map
+
+
+def group_bindings(bindings):
+    """
+    Group SPARQL result bindings by concept.
+
     For each property value:
     - If it has a language tag (xml:lang), use that language
     - If no language tag, use 'undefined'
-    - Insert as 'original' status translation
+
+    Args:
+        bindings: Iterable of SPARQL result bindings, ordered by concept
+
+    Returns:
+        dict: concept URI -> list of {"property", "value", "language"} dicts;
+        the list is empty for a concept without any harvested property
+    """
+    # Group bindings by concept to process all properties together. The query
+    # is ORDER BY STR(?concept), so bindings are grouped online as they stream in
+    binding_count = 0
+    concept_data = {}
+    for concept_uri, group in groupby(
+        bindings, key=lambda binding: binding.get("concept", {}).get("value", "")
+    ):
+        if not concept_uri:
+            binding_count += sum(1 for _ in group)
+            continue
+
+        properties = concept_data.setdefault(concept_uri, [])
+        for binding in group:
+            binding_count += 1
+            property_uri = binding.get("property", {}).get("value", "")
+            value_data = binding.get("value", {})
+
+            if property_uri and value_data:
+                properties.append({
+                    "property": property_uri,
+                    "value": value_data.get("value"),
+                    "language": value_data.get("xml:lang", "undefined")  # Use 'undefined' if no language tag
+                })
+
+    print(f"Processing {binding_count} results...")
+    return concept_data
+
+
+def translations_support_originals(conn):
+    """
+    Check if migration 014 has been applied (translations table has the
+    status and source columns needed for 'original' translations).
+
+    Args:
+        conn: Database connection
+
+    Returns:
+        bool: True if original translations can be inserted
+    """
+    columns = {col[1] for col in conn.execute("PRAGMA table_info(translations)")}
+    return 'status' in columns and 'source' in columns
+
+
+def insert_results(conn, collection_uri, concept_data, insert_originals=True):
+    """
+    Insert or update query results into the SQLite database.
+    
+    Processes ALL language variants from RDF data.
+    Each property value is inserted as 'original' status translation.
 
     For existing databases:
     - Existing terms are updated with new `updated_at` timestamp
@@ -203,145 +442,122 @@ def insert_results(conn, collection_uri, results):
     Args:
         conn: Database connection
         collection_uri: URI of the collection
-        results: SPARQL query results
+        concept_data: Bindings grouped by concept, as returned by group_bindings
+        insert_originals: Whether to insert 'original' translations; False for
+            databases from before migration 014 (see translations_support_originals)
+
+    Returns:
+        tuple: (terms inserted, terms updated, term fields inserted,
+            original translations inserted) for this batch
     """
     cursor = conn.cursor()
 
-    bindings = results.get("results", {}).get("bindings", [])
-
-    print(f"Processing {len(bindings)} results...")
-
     # Track statistics
     terms_inserted = 0
     terms_updated = 0
     term_fields_inserted = 0
     originals_inserted = 0
 
-    # Track processed terms to avoid redundant updates
-    terms_processed = set()
-    
-    # Check if migration 014 has been applied (translations table has status column)
-    # Do this once before the loop to avoid repeated PRAGMA queries
-    cursor.execute("PRAGMA table_info(translations)")
-    columns = [col[1] for col in cursor.fetchall()]
-    has_new_schema = 'status' in columns and 'source' in columns
-    
-    # Group bindings by concept to process all properties together
-    concept_data = {}
-    for binding in bindings:
-        concept_uri = binding.get("concept", {}).get("value", "")
-        if not concept_uri:
-            continue
-            
-        if concept_uri not in concept_data:
-            concept_data[concept_uri] = []
-        
-        property_uri = binding.get("property", {}).get("value", "")
-        value_data = binding.get("value", {})
-        
-        if property_uri and value_data:
-            concept_data[concept_uri].append({
-                "property": property_uri,
-                "value": value_data.get("value"),
-                "language": value_data.get("xml:lang", "undefined")  # Use 'undefined' if no language tag
-            })
-
-    # Process each concept
-    for concept_uri, properties in concept_data.items():
-        # Check if term already exists
-        if concept_uri not in terms_processed:
-            cursor.execute("SELECT id FROM terms WHERE uri = ?", (concept_uri,))
-            existing_term = cursor.fetchone()
-
-            if existing_term:
-                # Update existing term's updated_at timestamp
-                cursor.execute(
-                    """
-                    UPDATE terms SET updated_at = CURRENT_TIMESTAMP WHERE uri = ?
-                """,
-                    (concept_uri,),
-                )
-                terms_updated += 1
-            else:
-                # Insert new term
+    # Write the whole batch in one explicit transaction
+    cursor.execute("BEGIN IMMEDIATE")
+    try:
+        # Resolve all terms of the batch with a few set-based statements instead of
+        # a SELECT + (UPDATE or INSERT) + SELECT round-trip per concept
+        term_id_map = {}
+        for uris in chunked(list(concept_data)):
+            # One lookup tells which terms exist and gives their ids;
+            # insert vs update is then decided by set membership in Python
+            cursor.execute(in_clause_sql(SQL_SELECT_TERM_IDS, len(uris)), uris)
+            existing_terms = dict(cursor.fetchall())
+            term_id_map.update(existing_terms)
+            new_uris = [uri for uri in uris if uri not in existing_terms]
+
+            if existing_terms:
+                # Update existing terms' updated_at timestamp
+                existing_ids = list(existing_terms.values())
                 cursor.execute(
-                    """
-                    INSERT INTO terms (uri) VALUES (?)
-                """,
-                    (concept_uri,),
+                    in_clause_sql(SQL_TOUCH_TERMS, len(existing_ids)), existing_ids
                 )
-                terms_inserted += 1
+                terms_updated += len(existing_ids)
+
+            if new_uris:
+                terms_inserted += len(new_uris)
+
+                if SQLITE_HAS_RETURNING:
+                    # Insert the chunk and get its ids back in one statement
+                    cursor.execute(
+                        in_clause_sql(SQL_INSERT_TERMS_RETURNING, len(new_uris), "(?)"),
+                        new_uris,
+                    )
+                else:
+                    cursor.executemany(SQL_INSERT_TERM, [(uri,) for uri in new_uris])
+                    cursor.execute(
+                        in_clause_sql(SQL_SELECT_TERM_IDS, len(new_uris)), new_uris
+                    )
+                term_id_map.update(cursor.fetchall())
+
+        # Collect term_field and translation rows for the whole batch.
+        # Only the first value we encounter for a field is kept as its
+        # original_value (we only store one per field, for backward compatibility),
+        # and likewise the first value per field and language becomes the
+        # original translation, so duplicates never reach SQLite
+        field_rows = {}
+        value_rows = {}
+        for concept_uri, properties in concept_data.items():
+            term_id = term_id_map.get(concept_uri)
+            if term_id is None:
+                continue
 
-            terms_processed.add(concept_uri)
+            # Process each property-value pair
+            for prop_data in properties:
+                property_uri = prop_data["property"]
+                value = prop_data["value"]
+                language = prop_data["language"]
+
+                # Skip empty or whitespace-only values to prevent offering empty content for translation
+                if not value or not value.strip():
+                    continue
+
+                # Map property URI to field_uri
+                if property_uri not in _ALLOWED_FIELD_URIS:
+                    continue
+                field_uri = property_uri
+
+                field_rows.setdefault((term_id, field_uri), value)
+                value_rows.setdefault((term_id, field_uri, language), value)
+
+        # Map (term_id, field_uri) -> term_field_id, then insert only the missing
+        # fields in one executemany (ignored inserts would still burn AUTOINCREMENT ids)
+        term_field_map = fetch_term_field_ids(cursor, list(term_id_map.values()))
+        new_fields = [
+            (term_id, field_uri, value)
+            for (term_id, field_uri), value in field_rows.items()
+            if (term_id, field_uri) not in term_field_map
+        ]
+        if new_fields:
+            cursor.executemany(SQL_INSERT_TERM_FIELD, new_fields)
+            term_fields_inserted += cursor.rowcount
+            term_field_map.update(
+                fetch_term_field_ids(cursor, list({row[0] for row in new_fields}))
+            )
 
-        # Get term_id
-        cursor.execute("SELECT id FROM terms WHERE uri = ?", (concept_uri,))
-        term_row = cursor.fetchone()
-        if not term_row:
-            continue
-        term_id = term_row[0]
-
-        # Process each property-value pair
-        for prop_data in properties:
-            property_uri = prop_data["property"]
-            value = prop_data["value"]
-            language = prop_data["language"]
-            
-            # Skip empty or whitespace-only values to prevent offering empty content for translation
-            if not value or not value.strip():
-                continue
-            
-            # Map property URI to field_uri
-            field_uri = None
-            for field_name, uri in FIELD_MAPPINGS.items():
-                if property_uri == uri:
-                    field_uri = uri
-                    break
-            
-            if not field_uri:
-                continue
-            
-            # Try to insert term_field using the first value we encounter for this field
-            # We only store one original_value per field (for backward compatibility)
-            cursor.execute(
-                """
-                SELECT id FROM term_fields 
-                WHERE term_id = ? AND field_uri = ?
-                """,
-                (term_id, field_uri),
+        if insert_originals:
+            # Insert 'original' translation for each language variant in one executemany.
+            # Use INSERT OR IGNORE to avoid duplicates (same field, language, status combination);
+            # cursor.rowcount sums the rows actually inserted (FTS trigger writes excluded)
+            cursor.executemany(
+                SQL_INSERT_ORIGINAL_TRANSLATION,
+                [
+                    (term_field_map[(term_id, field_uri)], language, value)
+                    for (term_id, field_uri, language), value in value_rows.items()
+                ],
             )
-            term_field_row = cursor.fetchone()
-            
-            if not term_field_row:
-                # Insert new term_field with this value as original_value
-                cursor.execute(
-                    """
-                    INSERT INTO term_fields 
-                    (term_id, field_uri, original_value)
-                    VALUES (?, ?, ?)
-                """,
-                    (term_id, field_uri, value),
-                )
-                term_fields_inserted += 1
-                term_field_id = cursor.lastrowid
-            else:
-                term_field_id = term_field_row[0]
-            
-            if has_new_schema:
-                # Insert 'original' translation for each language variant
-                # Use INSERT OR IGNORE to avoid duplicates (same field, language, status combination)
-                cursor.execute(
-                    """
-                    INSERT OR IGNORE INTO translations 
-                    (term_field_id, language, value, status, source)
-                    VALUES (?, ?, ?, 'original', 'rdf-ingest')
-                    """,
-                    (term_field_id, language, value),
-                )
-                if cursor.rowcount > 0:
-                    originals_inserted += 1
+            originals_inserted += max(cursor.rowcount, 0)
 
-    conn.commit()
+        cursor.execute("COMMIT")
+    except Exception:
+        cursor.execute("ROLLBACK")
+        raise
 
     # Print summary
     print(f"Harvest summary:")
@@ -350,6 +566,8 @@ def insert_results(conn, collection_uri, results):
     print(f"  - New term fields inserted: {term_fields_inserted}")
     print(f"  - Original translations inserted: {originals_inserted}")
 
+    return terms_inserted, terms_updated, term_fields_inserted, originals_inserted
+
 
 def main():
     """Main execution function."""
@@ -372,12 +590,22 @@ def main():
         if not os.path.exists(output_path):
             raise FileNotFoundError(f"Database file does not exist: {output_path}")
         
-        # Connect to database (must already exist and have schema)
-        conn = sqlite3.connect(output_path)
+        # Connect to database (must already exist and have schema).
+        # Transactions are managed explicitly, one per batch in insert_results
+        conn = sqlite3.connect(
+            output_path,
+            isolation_level=None,
+            cached_statements=SQL_STATEMENT_CACHE_SIZE,
+        )
         
         # Enable foreign keys
         cursor = conn.cursor()
         cursor.execute("PRAGMA foreign_keys = ON")
+
+        # Per-connection tuning for the bulk write workload
+        cursor.execute("PRAGMA temp_store = MEMORY")
+        cursor.execute("PRAGMA cache_size = -65536")  # 64 MiB
+        cursor.execute("PRAGMA mmap_size = 268435456")  # 256 MiB
         
         # Verify required tables exist
         cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='terms'")
@@ -385,19 +613,55 @@ def main():
             conn.close()
             raise sqlite3.DatabaseError(f"Database schema not initialized. Missing 'terms' table in {output_path}")
 
-        # Get member count
-        print("Querying for member count...")
-        member_count = get_member_count(collection_uri)
-        print(f"Total members in collection: {member_count}")
-        batch_size = 1000
+        # The schema cannot change during a harvest, so specialize the batch
+        # writer once instead of probing the translations table per batch
+        insert_batch = partial(
+            insert_results, insert_originals=translations_support_originals(conn)
+        )
 
-        # Loop to fetch and insert results in batches
-        for offset in range(0, member_count, batch_size):
-            print(f"Fetching batch: OFFSET={offset} LIMIT={batch_size}")
-            results = query_sparql_endpoint(
-                collection_uri, limit=batch_size, offset=offset
+        batch_size = 1000
+        totals = [0, 0, 0, 0]
+
+        # Keyset pagination: each batch asks for the concepts sorting after the
+        # last concept of the previous batch, until a batch comes back empty, so no
+        # member count query is needed up front.
+        # The next batch is fetched in the background while the current one
+        # is written (SQLite writes stay on this thread)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            print(f"Fetching batch: LIMIT={batch_size}")
+            pending = executor.submit(
+                query_sparql_endpoint, collection_uri, limit=batch_size
             )
-            insert_results(conn, collection_uri, results)
+            while True:
+                page = group_bindings(pending.result())
+                if not page:
+                    break
+
+                # The cursor is the last concept of the page, including members
+                # without any harvested property, which are not stored
+                after_uri = max(page)
+                print(f"Fetching batch: AFTER={after_uri} LIMIT={batch_size}")
+                pending = executor.submit(
+                    query_sparql_endpoint,
+                    collection_uri,
+                    limit=batch_size,
+                    after_uri=after_uri,
+                )
+                concept_data = {
+                    uri: properties for uri, properties in page.items() if properties
+                }
+                if concept_data:
+                    stats = insert_batch(conn, collection_uri, concept_data)
+                    totals = [total + count for total, count in zip(totals, stats)]
+
+        print("Harvest totals:")
+        print(f"  - New terms inserted: {totals[0]}")
+        print(f"  - Existing terms updated: {totals[1]}")
+        print(f"  - New term fields inserted: {totals[2]}")
+        print(f"  - Original translations inserted: {totals[3]}")
+
+        # Refresh query planner statistics once, now that the bulk load is done
+        cursor.execute("PRAGMA optimize")
 
         # Close connection
         conn.close()
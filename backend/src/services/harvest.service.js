@@ -114,10 +114,12 @@ function parseHarvestOutput(output) {
     output: output,
   };
 
-  // Extract statistics from output
-  const termsInsertedMatch = output.match(/New terms inserted:\s*(\d+)/);
-  const termsUpdatedMatch = output.match(/Existing terms updated:\s*(\d+)/);
-  const fieldsInsertedMatch = output.match(/New term fields inserted:\s*(\d+)/);
+  // Extract statistics from output. The script prints a summary per batch
+  // followed by the harvest totals, so the last match is the total.
+  const lastMatch = (pattern) => [...output.matchAll(pattern)].pop();
+  const termsInsertedMatch = lastMatch(/New terms inserted:\s*(\d+)/g);
+  const termsUpdatedMatch = lastMatch(/Existing terms updated:\s*(\d+)/g);
+  const fieldsInsertedMatch = lastMatch(/New term fields inserted:\s*(\d+)/g);
 
   if (termsInsertedMatch) {
     result.termsInserted = parseInt(termsInsertedMatch[1], 10);
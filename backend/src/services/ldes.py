@@ -8,24 +8,100 @@ import sys
 import sqlite3
 import os
 import json
+import logging
+import re
 import shutil
+import mmap
+import time
 import requests
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain
 from io import StringIO
 from datetime import datetime, timedelta
 from pathlib import Path
-from sema.subyt import (
-    JinjaBasedGenerator,
-    SinkFactory,
-    SourceFactory,
-    GeneratorSettings,
+
+logger = logging.getLogger(__name__)
+
+# Translation record returned by query_translations_for_ldes
+TranslationRow = namedtuple("TranslationRow", [
+    "translation_id",
+    "translation_value",
+    "language",
+    "status",
+    "modified_at",
+    "event_at",
+    "term_field_id",
+    "field_uri",
+    "original_value",
+    "term_id",
+    "term_uri",
+])
+
+# Source metadata returned by query_source
+SourceRow = namedtuple("SourceRow", [
+    "translation_config",
+    "source_path",
+    "source_type",
+    "cached_source_path",
+    "cached_timestamp_path",
+    "cached_versionof_path",
+    "cached_resolved_at",
+])
+
+# Fragment template, rendered with py-sema's RDF syntax filters (uri, xsd)
+LDES_TEMPLATES_FOLDER = Path(__file__).parent / "ldes_templates"
+LDES_FRAGMENT_TEMPLATE = "ldes_fragment.ttl"
+
+# Default LDES base directory: data/LDES under the project root. This script
+# is in backend/src/services, so go up 3 levels to project root
+DEFAULT_LDES_BASE_DIR = Path(__file__).parent.parent.parent.parent / "data" / "LDES"
+
+# LDES directories already created by generate_ldes_fragment in this process
+_ensured_ldes_dirs = set()
+
+# Rows fetched from SQLite per round-trip when streaming translations
+FETCH_BATCH_SIZE = 1000
+
+# SQLite connections opened by get_connection, keyed by (process ID, db_path)
+_connections = {}
+
+# HTTP session for upstream LDES feeds, reusing connections across requests
+SESSION = requests.Session()
+SESSION.headers.update({"Accept": "text/turtle, */*;q=0.8"})
+
+# LDES vocabulary namespace
+LDES_NAMESPACE = "https://w3id.org/ldes#"
+
+# Turtle/SPARQL-style prefix declarations: (prefix, namespace IRI)
+TURTLE_PREFIX_RE = re.compile(r"(?:@prefix|PREFIX)\s+([A-Za-z][\w.-]*)?:\s*<([^>]*)>", re.IGNORECASE)
+
+# ldes:timestampPath / ldes:versionOfPath statements in a feed. Groups:
+# 1 name as full IRI, or 2 prefix + 3 name; object 4 as IRI, or 5 prefix + 6 local name.
+# The local name also takes ':', '%' and '\\' so that such names can be
+# rejected, and the object must end the statement or be followed by ; , ]
+LDES_PATH_RE = re.compile(
+    r"(?:<https://w3id\.org/ldes#(timestampPath|versionOfPath)>"
+    r"|(?<![\w.:-])([A-Za-z][\w.-]*)?:(timestampPath|versionOfPath))"
+    r"\s+(?:<([^>]*)>|(?<![\w.:-])([A-Za-z][\w.-]*)?:((?:[\w:%\\-]|\.(?=[\w:%\\-]))*))"
+    r"(?=\s*(?:[;,.\]]|\Z))"
 )
-from rdflib import Graph, Namespace, URIRef, Literal
-from rdflib.namespace import RDF, DCTERMS, XSD
 
-# LDES and TREE namespaces
-LDES = Namespace("https://w3id.org/ldes#")
-TREE = Namespace("https://w3id.org/tree#")
-SKOS = Namespace("http://www.w3.org/2004/02/skos/core#")
+# Subject term ending right before a predicate: full IRI, prefixed name or blank node label
+TURTLE_SUBJECT_RE = re.compile(r"(?:<[^<>\s]*>|(?<![\w.:-])(?:[A-Za-z][\w.-]*)?:[\w.-]*|_:[\w.-]+)\Z")
+
+# IRI with a scheme, i.e. one that needs no base to resolve
+ABSOLUTE_IRI_RE = re.compile(r"[A-Za-z][A-Za-z0-9+.-]*:")
+
+# Lifetime of cached LDES paths of an upstream feed (in process and in
+# the source_ldes_paths table), in seconds
+LDES_PATHS_CACHE_TTL = 3600
+
+# dcterms:modified literal in a fragment, prefixed or as a full IRI
+MODIFIED_LITERAL_RE = re.compile(
+    rb"""(?:dcterms:modified|<http://purl\.org/dc/terms/modified>)\s+["']([^"']+)["']"""
+)
 
 
 def parse_datetime(value):
@@ -48,6 +124,69 @@ def parse_datetime(value):
     return datetime.fromisoformat(normalized)
 
 
+def get_connection(db_path):
+    """
+    Return this process's SQLite connection to db_path, opening it on first use.
+
+    All queries of an LDES run share one connection instead of opening and
+    closing the database per step. The key includes the process ID so worker
+    processes forked by create_or_update_ldes_many never reuse a parent's
+    connection. The journal mode is left to the backend.
+
+    Args:
+        db_path: Path to the SQLite database
+
+    Returns:
+        sqlite3.Connection: Shared connection
+    """
+    key = (os.getpid(), db_path)
+    conn = _connections.get(key)
+    if conn is None:
+        conn = _connections[key] = sqlite3.connect(db_path)
+        # Read-side tuning for the export query (sort spill in RAM,
+        # memory-mapped pages, larger page cache)
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA mmap_size = 268435456")  # 256 MiB
+        conn.execute("PRAGMA cache_size = -65536")  # 64 MiB
+    return conn
+
+
+@lru_cache(maxsize=None)
+def get_fragment_renderer(template_name):
+    """
+    Load and compile an LDES template once per process.
+
+    Args:
+        template_name: Template file name in the ldes_templates folder
+
+    Returns:
+        Render function of the compiled template
+    """
+    # Imported here: py-sema pulls in rdflib, which runs that never render a
+    # fragment (e.g. nothing approved) do not need to load
+    from sema.subyt import JinjaBasedGenerator
+
+    return JinjaBasedGenerator(str(LDES_TEMPLATES_FOLDER)).make_render_fn(template_name)
+
+
+@lru_cache(maxsize=4096)
+def format_xsd_datetime(value):
+    """
+    Format a database/LDES datetime value as an xsd:dateTime string.
+
+    Cached because many records share a timestamp (bulk approvals, or
+    events moved past the previous fragment), so each distinct value is
+    parsed only once.
+
+    Args:
+        value: Datetime value as string
+
+    Returns:
+        str: Datetime formatted as YYYY-MM-DDTHH:MM:SSZ
+    """
+    return parse_datetime(value).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
 def get_ldes_directory(source_id):
     """
     Get the LDES directory path for a given source.
@@ -58,15 +197,10 @@ def get_ldes_directory(source_id):
     Returns:
         Path object for the LDES directory
     """
-    # Use environment variable or default to /data/LDES relative to project root
+    # Use environment variable or default to /data/LDES relative to project root.
+    # The variable is still read per call so it can be set after import
     ldes_base = os.environ.get('LDES_BASE_DIR')
-    if ldes_base:
-        base_dir = Path(ldes_base)
-    else:
-        # Default: find data/LDES relative to this script's location
-        # This script is in backend/src/services, so go up 3 levels to project root
-        project_root = Path(__file__).parent.parent.parent.parent
-        base_dir = project_root / "data" / "LDES"
+    base_dir = Path(ldes_base) if ldes_base else DEFAULT_LDES_BASE_DIR
     
     ldes_dir = base_dir / str(source_id)
     return ldes_dir
@@ -104,8 +238,12 @@ def detect_existing_ldes(source_id):
 
 def get_latest_modified_from_fragment(fragment_path):
     """
-    Parse an LDES fragment and find the latest dcterms:modified date.
-    
+    Scan an LDES fragment and find the latest dcterms:modified date.
+
+    The fragment is memory-mapped and scanned with a single regex pass, so no
+    per-line strings are built and only distinct dcterms:modified literals are
+    parsed.
+
     Args:
         fragment_path: Path to the fragment file
         
@@ -113,28 +251,25 @@ def get_latest_modified_from_fragment(fragment_path):
         datetime object of the latest modified date, or None
     """
     try:
-        g = Graph()
-        g.parse(fragment_path, format="turtle")
-        
-        # Query for all dcterms:modified values
-        modified_dates = []
-        for s, p, o in g.triples((None, DCTERMS.modified, None)):
-            if isinstance(o, Literal):
-                try:
-                    # Parse the datetime
-                    dt = o.toPython()
-                    if isinstance(dt, datetime):
-                        modified_dates.append(dt)
-                except Exception:
-                    # Skip invalid datetime literals
-                    pass
-        
-        if modified_dates:
-            return max(modified_dates)
-        
-        return None
+        with open(fragment_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                literals = {match.group(1) for match in MODIFIED_LITERAL_RE.finditer(mm)}
+
+        latest_modified = None
+        for literal in literals:
+            try:
+                dt = parse_datetime(literal.decode("utf-8"))
+            except ValueError:
+                # Skip invalid datetime literals
+                continue
+            if latest_modified is None or dt > latest_modified:
+                latest_modified = dt
+
+        return latest_modified
     except Exception as e:
-        print(f"Error parsing fragment {fragment_path}: {e}")
+        logger.warning("Error parsing fragment %s: %s", fragment_path, e)
         return None
 
 
@@ -151,36 +286,28 @@ def get_previous_fragment(source_id):
     """
     ldes_dir = get_ldes_directory(source_id)
     
-    if not ldes_dir.exists():
-        return None, None
-    
-    # Find all .ttl files except latest.ttl
-    ttl_files = [f for f in ldes_dir.glob("*.ttl") if f.name != "latest.ttl"]
-    
-    if not ttl_files:
+    # Take the highest epoch among the fragment file names ("1768758532.ttl");
+    # scandir yields names without a stat() per file, and max() needs no sort
+    latest_epoch = None
+    try:
+        with os.scandir(ldes_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.endswith(".ttl") or name == "latest.ttl":
+                    continue
+                try:
+                    epoch = int(name[:-4])
+                except ValueError:
+                    # Skip non-numeric filenames
+                    continue
+                if latest_epoch is None or epoch > latest_epoch:
+                    latest_epoch = epoch
+    except FileNotFoundError:
         return None, None
     
-    # Extract epoch timestamps from filenames
-    epoch_fragments = []
-    for f in ttl_files:
-        try:
-            # Filename should be like "1768758532.ttl"
-            epoch_str = f.stem  # Remove .ttl extension
-            epoch = int(epoch_str)
-            epoch_fragments.append((epoch, f))
-        except ValueError:
-            # Skip non-numeric filenames
-            continue
-    
-    if not epoch_fragments:
+    if latest_epoch is None:
         return None, None
     
-    # Sort by epoch timestamp (highest first)
-    epoch_fragments.sort(reverse=True)
-    
-    # Get the most recent fragment
-    latest_epoch, latest_file = epoch_fragments[0]
-    
     # Convert epoch to datetime
     fragment_datetime = datetime.fromtimestamp(latest_epoch)
     
@@ -199,27 +326,25 @@ def query_translations_for_ldes(db_path, source_id, start_date=None, end_date=No
         start_date: Optional start date (datetime)
         end_date: Optional end date (datetime)
         
-    Returns:
-        List of translation records as dictionaries.
+    Yields:
+        TranslationRow records in event timestamp order, streamed from the
+        cursor in batches of FETCH_BATCH_SIZE rows.
         Each record includes:
         - modified_at: original translation modified/created timestamp
         - event_at: effective event timestamp used for LDES incremental logic
           (COALESCE(updated_at, modified_at, created_at))
     """
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
+    cursor = get_connection(db_path).cursor()
     
-    # Build the query
+    # Build the query; columns are in TranslationRow order
     query = """
         SELECT 
             t.id as translation_id,
             t.value as translation_value,
             t.language,
             t.status,
-            t.modified_at,
-            t.created_at,
-            t.updated_at,
+            COALESCE(t.modified_at, t.created_at) as modified_at,
+            COALESCE(t.updated_at, t.modified_at, t.created_at) as event_at,
             tf.id as term_field_id,
             tf.field_uri,
             tf.original_value,
@@ -234,7 +359,8 @@ def query_translations_for_ldes(db_path, source_id, start_date=None, end_date=No
     
     params = [source_id]
     
-    # Add date filters if provided
+    # Add date filters if provided. Filters and ordering use the same expression
+    # as the idx_translations_status_event index, so SQLite can range-scan it
     if start_date:
         query += " AND datetime(COALESCE(t.updated_at, t.modified_at, t.created_at)) >= datetime(?)"
         params.append(start_date.isoformat())
@@ -245,62 +371,70 @@ def query_translations_for_ldes(db_path, source_id, start_date=None, end_date=No
     
     query += " ORDER BY datetime(COALESCE(t.updated_at, t.modified_at, t.created_at)) ASC"
     
-    print(f"Executing translation query with params: {params}")
-    print(f"Query: {query}")
-    
-    cursor.execute(query, params)
-    rows = cursor.fetchall()
-    
-    # Convert rows to dictionaries
-    results = []
-    for row in rows:
-        results.append({
-            'translation_id': row['translation_id'],
-            'translation_value': row['translation_value'],
-            'language': row['language'],
-            'status': row['status'],
-            'modified_at': row['modified_at'] or row['created_at'],
-            'event_at': row['updated_at'] or row['modified_at'] or row['created_at'],
-            'term_field_id': row['term_field_id'],
-            'field_uri': row['field_uri'],
-            'original_value': row['original_value'],
-            'term_id': row['term_id'],
-            'term_uri': row['term_uri'],
-        })
+    logger.debug("Executing translation query with params: %s", params)
+    logger.debug("Query: %s", query)
     
-    conn.close()
-    return results
+    try:
+        cursor.execute(query, params)
+        while True:
+            rows = cursor.fetchmany(FETCH_BATCH_SIZE)
+            if not rows:
+                break
+            for row in rows:
+                yield TranslationRow._make(row)
+    finally:
+        cursor.close()
 
 
-def extract_types_from_source(db_path, source_id):
+def query_source(db_path, source_id):
     """
-    Extract the type URIs from a source's translation_config column.
+    Fetch the metadata of a source needed for LDES generation in one query.
     
     Args:
         db_path: Path to the SQLite database
         source_id: Source identifier
         
     Returns:
-        List of type URIs (e.g., ["http://qudt.org/schema/qudt/CoordinateSystem"])
-        Returns empty list if no types found or on error.
+        SourceRow, or None if the source does not exist
     """
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+    cursor = get_connection(db_path).cursor()
     
     try:
-        # Query the translation_config from sources table
         cursor.execute(
-            "SELECT translation_config FROM sources WHERE source_id = ?",
+            """
+            SELECT s.translation_config, s.source_path, s.source_type,
+                   p.source_path, p.timestamp_path, p.versionof_path, p.resolved_at
+            FROM sources s
+            LEFT JOIN source_ldes_paths p ON p.source_id = s.source_id
+            WHERE s.source_id = ?
+            """,
             [source_id]
         )
         row = cursor.fetchone()
+        return SourceRow._make(row) if row else None
+    finally:
+        cursor.close()
+
+
+def extract_types_from_source(source_id, source):
+    """
+    Extract the type URIs from a source's translation_config column.
+    
+    Args:
+        source_id: Source identifier
+        source: SourceRow from query_source, or None
         
-        if not row or not row[0]:
-            print(f"No translation_config found for source {source_id}")
+    Returns:
+        List of type URIs (e.g., ["http://qudt.org/schema/qudt/CoordinateSystem"])
+        Returns empty list if no types found or on error.
+    """
+    try:
+        if not source or not source.translation_config:
+            logger.info("No translation_config found for source %s", source_id)
             return []
         
         # Parse the JSON string
-        config = json.loads(row[0])
+        config = json.loads(source.translation_config)
         
         # Extract type URIs from types array
         types = []
@@ -309,30 +443,204 @@ def extract_types_from_source(db_path, source_id):
                 if isinstance(type_obj, dict) and 'type' in type_obj:
                     types.append(type_obj['type'])
         
-        print(f"Extracted types for source {source_id}: {types}")
+        logger.info("Extracted types for source %s: %s", source_id, types)
         return types
         
     except json.JSONDecodeError as e:
-        print(f"Error parsing translation_config JSON for source {source_id}: {e}")
+        logger.error("Error parsing translation_config JSON for source %s: %s", source_id, e)
         return []
     except Exception as e:
-        print(f"Error extracting types for source {source_id}: {e}")
+        logger.error("Error extracting types for source %s: %s", source_id, e)
         return []
-    finally:
-        conn.close()
 
 
-def extract_ldes_paths_from_source(db_path, source_id=1):
+def follows_comment_or_quote(text, pos):
+    """
+    Tell whether a comment marker or quote precedes pos on its line, i.e.
+    whether the text at pos may sit inside a comment or a string literal.
+
+    Args:
+        text: Turtle document
+        pos: Offset into text
+
+    Returns:
+        bool: True if '#', '"' or "'" occurs between the line start and pos
+    """
+    before = text[text.rfind('\n', 0, pos) + 1:pos]
+    return '#' in before or '"' in before or "'" in before
+
+
+def in_predicate_position(text, pos, directive_ends):
+    """
+    Tell whether the term at pos is a predicate, i.e. follows a ';' or a
+    subject that itself starts a statement.
+
+    Args:
+        text: Turtle document
+        pos: Offset of the term into text
+        directive_ends: Offsets where SPARQL-style PREFIX directives end
+
+    Returns:
+        bool: True if the term is known to be in predicate position
+    """
+    before = text[:pos].rstrip()
+    if before.endswith(';'):
+        return True
+
+    subject = TURTLE_SUBJECT_RE.search(before)
+    if subject is None:
+        return False
+
+    # Before the subject: start of the document, the end of a statement or
+    # of a directive
+    rest = before[:subject.start()].rstrip()
+    return not rest or rest.endswith('.') or len(rest) in directive_ends
+
+
+def scan_ldes_paths(ttl_content):
+    """
+    Read ldes:timestampPath and ldes:versionOfPath from Turtle text with
+    regexes instead of parsing the whole document.
+
+    The scan is conservative: it gives up as soon as the text is ambiguous
+    without a real parser, e.g. a match that may be inside a comment or a
+    string literal or is not in predicate position, a path stated more than
+    once, a prefix declared twice, a local name with ':', '%' or escapes, or
+    a path that would need a base IRI to resolve.
+
+    Args:
+        ttl_content: Turtle document of an LDES feed
+
+    Returns:
+        tuple: (timestampPath or None, versionOfPath or None), or None when a
+        path is mentioned but cannot be resolved this way (relative IRI,
+        undeclared prefix, ambiguous or unusual syntax) and the feed has to
+        be parsed
+    """
+    # Triple-quoted literals can span lines, which the per-line checks below
+    # cannot see
+    if '"""' in ttl_content or "'''" in ttl_content:
+        return None
+
+    prefixes = {}
+    directive_ends = set()
+    for match in TURTLE_PREFIX_RE.finditer(ttl_content):
+        prefix, namespace = match.group(1) or '', match.group(2)
+        if follows_comment_or_quote(ttl_content, match.start()):
+            return None
+        if prefixes.setdefault(prefix, namespace) != namespace:
+            return None
+        directive_ends.add(match.end())
+
+    paths = {}
+    for match in LDES_PATH_RE.finditer(ttl_content):
+        if follows_comment_or_quote(ttl_content, match.start()):
+            return None
+
+        name = match.group(1) or match.group(3)
+        if match.group(3) and prefixes.get(match.group(2) or '') != LDES_NAMESPACE:
+            continue
+        if name in paths:
+            # Several statements for the same path: leave it to rdflib
+            return None
+        if not in_predicate_position(ttl_content, match.start(), directive_ends):
+            return None
+
+        if match.group(4) is not None:
+            value = match.group(4)
+        else:
+            namespace = prefixes.get(match.group(5) or '')
+            local_name = match.group(6)
+            if namespace is None or ':' in local_name or '%' in local_name or '\\' in local_name:
+                return None
+            value = namespace + local_name
+        if '\\' in value:
+            # \uXXXX / \UXXXXXXXX escapes in the IRI or its namespace,
+            # decoding them is left to rdflib
+            return None
+        if not ABSOLUTE_IRI_RE.match(value):
+            # Relative IRI, resolving it is left to rdflib
+            return None
+        paths[name] = value
+
+    # Any mention besides the one statement matched above, e.g. inside a
+    # literal or in a form the regex skipped, needs a real parse
+    for name in ('timestampPath', 'versionOfPath'):
+        if ttl_content.count(name) != (name in paths):
+            return None
+
+    return paths.get('timestampPath'), paths.get('versionOfPath')
+
+
+@lru_cache(maxsize=64)
+def fetch_ldes_paths(source_path, ttl_bucket):
+    """
+    Fetch an upstream LDES feed and read its ldes:timestampPath and
+    ldes:versionOfPath.
+
+    Results are cached per process; ttl_bucket is part of the cache key so
+    entries expire when the bucket (time.monotonic() // LDES_PATHS_CACHE_TTL)
+    moves on. Failures raise and are therefore never cached. The paths are
+    read with scan_ldes_paths; the feed is only parsed with rdflib when that
+    cannot resolve them.
+
+    Args:
+        source_path: URI of the upstream LDES feed
+        ttl_bucket: Current cache time bucket
+
+    Returns:
+        tuple: (timestampPath or None, versionOfPath or None)
+
+    Raises:
+        requests.RequestException: If the feed cannot be fetched
+        Exception: If the feed is not valid Turtle
+    """
+    response = SESSION.get(source_path, timeout=30)
+    response.raise_for_status()
+    ttl_content = response.text
+
+    paths = scan_ldes_paths(ttl_content)
+    if paths is not None:
+        return paths
+
+    # rdflib is only needed here, so it is not loaded at module import
+    from rdflib import Graph, Namespace
+
+    # LDES namespace
+    LDES = Namespace(LDES_NAMESPACE)
+
+    g = Graph()
+    g.parse(StringIO(ttl_content), format="turtle", publicID=source_path)
+
+    # Extract ldes:timestampPath
+    timestamp_path = None
+    for s, p, o in g.triples((None, LDES.timestampPath, None)):
+        timestamp_path = str(o)
+        break
+
+    # Extract ldes:versionOfPath
+    versionof_path = None
+    for s, p, o in g.triples((None, LDES.versionOfPath, None)):
+        versionof_path = str(o)
+        break
+
+    return timestamp_path, versionof_path
+
+
+def extract_ldes_paths_from_source(db_path, source_id, source):
     """
     Extract ldes:timestampPath and ldes:versionOfPath from a source's LDES feed.
     
-    This function queries the sources table for the given source_id.
     If the source_type is 'LDES', it retrieves the TTL content from the source_path URI
-    and extracts the LDES properties.
+    and extracts the LDES properties. The properties the feed declares are
+    stored in the source_ldes_paths table, so later runs skip the
+    HTTP fetch while the source_path is unchanged and the entry is younger
+    than LDES_PATHS_CACHE_TTL.
     
     Args:
         db_path: Path to the SQLite database
-        source_id: Source identifier (default: 1)
+        source_id: Source identifier
+        source: SourceRow from query_source, or None
         
     Returns:
         tuple: (ldes_timestampPath_property, ldes_versionOfPath_property)
@@ -342,133 +650,169 @@ def extract_ldes_paths_from_source(db_path, source_id=1):
     default_timestamp = 'http://purl.org/dc/terms/modified'
     default_versionof = 'http://purl.org/dc/terms/isVersionOf'
     
-    conn = sqlite3.connect(db_path)
+    conn = get_connection(db_path)
     cursor = conn.cursor()
     
     try:
-        # Query source_path and source_type from sources table
-        cursor.execute(
-            "SELECT source_path, source_type FROM sources WHERE source_id = ?",
-            [source_id]
-        )
-        row = cursor.fetchone()
-        
-        if not row:
-            print(f"No source found for source_id {source_id}")
+        if not source:
+            logger.info("No source found for source_id %s", source_id)
             return default_timestamp, default_versionof
         
-        source_path, source_type = row
+        source_path, source_type = source.source_path, source.source_type
         
         if source_type != 'LDES':
-            print(f"Source {source_id} is not of type LDES (type: {source_type})")
+            logger.info("Source %s is not of type LDES (type: %s)", source_id, source_type)
             return default_timestamp, default_versionof
         
         if not source_path:
-            print(f"No source_path found for source {source_id}")
+            logger.info("No source_path found for source %s", source_id)
             return default_timestamp, default_versionof
         
-        print(f"Retrieving LDES TTL from URI: {source_path}")
-        
-        # Fetch the TTL content from the URI
-        try:
-            response = requests.get(source_path, timeout=30)
-            response.raise_for_status()
-            ttl_content = response.text
-        except requests.RequestException as e:
-            print(f"Error fetching LDES TTL from {source_path}: {e}")
-            return default_timestamp, default_versionof
-        
-        # Parse the TTL content
-        g = Graph()
-        try:
-            g.parse(StringIO(ttl_content), format="turtle", publicID=source_path)
-        except Exception as e:
-            print(f"Error parsing TTL content from {source_path}: {e}")
-            return default_timestamp, default_versionof
-        
-        # Extract ldes:timestampPath
-        timestamp_path = None
-        for s, p, o in g.triples((None, LDES.timestampPath, None)):
-            timestamp_path = str(o)
-            break
-        
-        # Extract ldes:versionOfPath
-        versionof_path = None
-        for s, p, o in g.triples((None, LDES.versionOfPath, None)):
-            versionof_path = str(o)
-            break
+        # Reuse the paths an earlier run read from the same feed while they
+        # are fresh
+        if (source.cached_source_path == source_path
+                and time.time() - source.cached_resolved_at < LDES_PATHS_CACHE_TTL):
+            logger.info("Using cached LDES paths for %s", source_path)
+            timestamp_path = source.cached_timestamp_path
+            versionof_path = source.cached_versionof_path
+        else:
+            logger.info("Retrieving LDES TTL from URI: %s", source_path)
+            
+            # Fetch and parse the TTL content
+            ttl_bucket = int(time.monotonic() // LDES_PATHS_CACHE_TTL)
+            try:
+                timestamp_path, versionof_path = fetch_ldes_paths(source_path, ttl_bucket)
+            except requests.RequestException as e:
+                logger.error("Error fetching LDES TTL from %s: %s", source_path, e)
+                return default_timestamp, default_versionof
+            except Exception as e:
+                logger.error("Error parsing TTL content from %s: %s", source_path, e)
+                return default_timestamp, default_versionof
+            
+            # Remember what the feed declares (None where it declares nothing,
+            # so the defaults are never cached); failing to store it only
+            # means the next run fetches the feed again
+            try:
+                cursor.execute(
+                    "INSERT OR REPLACE INTO source_ldes_paths "
+                    "(source_id, source_path, timestamp_path, versionof_path, resolved_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [source_id, source_path, timestamp_path, versionof_path, time.time()]
+                )
+                conn.commit()
+            except sqlite3.Error as e:
+                conn.rollback()
+                logger.warning("Could not cache LDES paths for source %s: %s", source_id, e)
         
         # Use defaults if not found
         if not timestamp_path:
-            print(f"ldes:timestampPath not found in {source_path}, using default: {default_timestamp}")
+            logger.info("ldes:timestampPath not found in %s, using default: %s", source_path, default_timestamp)
             timestamp_path = default_timestamp
         else:
-            print(f"Found ldes:timestampPath: {timestamp_path}")
+            logger.info("Found ldes:timestampPath: %s", timestamp_path)
         
         if not versionof_path:
-            print(f"ldes:versionOfPath not found in {source_path}, using default: {default_versionof}")
+            logger.info("ldes:versionOfPath not found in %s, using default: %s", source_path, default_versionof)
             versionof_path = default_versionof
         else:
-            print(f"Found ldes:versionOfPath: {versionof_path}")
+            logger.info("Found ldes:versionOfPath: %s", versionof_path)
         
         return timestamp_path, versionof_path
         
     except Exception as e:
-        print(f"Error extracting LDES paths for source {source_id}: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error extracting LDES paths for source %s: %s", source_id, e)
         return default_timestamp, default_versionof
     finally:
-        conn.close()
+        cursor.close()
+
+
+def adjust_event_times(translations, prev_fragment_datetime):
+    """
+    Move translation events that are not newer than the previous fragment to
+    one second after it, so fragments stay in monotonic order.
+
+    Args:
+        translations: Iterable of TranslationRow records
+        prev_fragment_datetime: Datetime of the previous fragment, or None
+
+    Yields:
+        TranslationRow records, with event_at adjusted where needed
+    """
+    if not prev_fragment_datetime:
+        yield from translations
+        return
+
+    prev_naive = prev_fragment_datetime.replace(tzinfo=None) if prev_fragment_datetime.tzinfo else prev_fragment_datetime
+    adjusted_event_at = (prev_naive + timedelta(seconds=1)).strftime("%Y-%m-%d %H:%M:%S")
+    # Records arrive in event order: once one is newer than the previous
+    # fragment, so are all that follow and they no longer need parsing
+    adjusting = True
+    for t in translations:
+        if adjusting:
+            t_dt = parse_datetime(t.event_at)
+            t_naive = t_dt.replace(tzinfo=None) if t_dt.tzinfo else t_dt
+            if t_naive <= prev_naive:
+                t = t._replace(event_at=adjusted_event_at)
+            else:
+                adjusting = False
+        yield t
 
 
 def prepare_ldes_data(translations):
     """
     Transform translation records into LDES-compatible format.
     Groups translations by term URI and preserves all field URIs dynamically.
+
+    The records are consumed in a single pass, so a streaming iterable is
+    never materialized as a list.
     
     Args:
-        translations: List of translation records
+        translations: Iterable of TranslationRow records, in event timestamp order
         
     Returns:
-        List of dictionaries suitable for LDES fragment generation
+        tuple: (list of dictionaries suitable for LDES fragment generation,
+                list of translation IDs,
+                event_at of the latest translation or None)
     """
     # Group translations by term URI
     terms_data = {}
+    translation_ids = []
+    latest_event_at = None
     
     for trans in translations:
-        term_uri = trans['term_uri']
-        field_uri = trans['field_uri']
-        
-        if term_uri not in terms_data:
-            # Format datetime as xsd:dateTime compliant string
-            modified_dt = parse_datetime(trans['event_at'])
-            modified_str = modified_dt.strftime("%Y-%m-%dT%H:%M:%SZ")
-            
-            terms_data[term_uri] = {
-                'concept': term_uri,
-                'modified': modified_str,  # Store as formatted string
+        translation_ids.append(trans.translation_id)
+        # Records arrive in event order, so the last one is the latest
+        latest_event_at = trans.event_at
+
+        # Look each term and field list up once and work on local references
+        term_data = terms_data.get(trans.term_uri)
+        if term_data is None:
+            term_data = terms_data[trans.term_uri] = {
+                'concept': trans.term_uri,
+                'modified': None,  # Formatted once all records are grouped
                 'fields': {}  # Store all fields dynamically
             }
         
-        # Update the latest modified date
-        trans_dt = parse_datetime(trans['event_at'])
-        current_dt = datetime.strptime(terms_data[term_uri]['modified'], "%Y-%m-%dT%H:%M:%SZ")
-        
-        if trans_dt > current_dt:
-            terms_data[term_uri]['modified'] = trans_dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+        # Update the latest modified date; records arrive in event order, so
+        # the raw event_at of the term's last record is its latest
+        term_data['modified'] = trans.event_at
         
         # Store field value by field_uri (dynamically)
         # Multiple values for the same field_uri are stored as a list
-        if field_uri not in terms_data[term_uri]['fields']:
-            terms_data[term_uri]['fields'][field_uri] = []
+        field_values = term_data['fields'].get(trans.field_uri)
+        if field_values is None:
+            field_values = term_data['fields'][trans.field_uri] = []
         
-        terms_data[term_uri]['fields'][field_uri].append({
-            'value': trans['translation_value'],
-            'language': trans['language']
+        field_values.append({
+            'value': trans.translation_value,
+            'language': trans.language
         })
     
-    return list(terms_data.values())
+    # Format each term's latest datetime as xsd:dateTime compliant string
+    for term_data in terms_data.values():
+        term_data['modified'] = format_xsd_datetime(term_data['modified'])
+    
+    return list(terms_data.values()), translation_ids, latest_event_at
 
 
 def generate_ldes_fragment(source_id, ldes_data, fragment_timestamp, prev_fragment_timestamp, prefix_uri, prev_fragment_time, types=None, ldes_timestampPath_property=None, ldes_versionOfPath_property=None):
@@ -489,65 +833,56 @@ def generate_ldes_fragment(source_id, ldes_data, fragment_timestamp, prev_fragme
     Returns:
         Path to the generated fragment file
     """
-    # Ensure LDES directory exists
+    # Ensure LDES directory exists (once per directory per process)
     ldes_dir = get_ldes_directory(source_id)
-    ldes_dir.mkdir(parents=True, exist_ok=True)
+    if ldes_dir not in _ensured_ldes_dirs:
+        ldes_dir.mkdir(parents=True, exist_ok=True)
+        _ensured_ldes_dirs.add(ldes_dir)
     
     # Prepare output file path
     fragment_filename = f"{fragment_timestamp}.ttl"
     output_file = ldes_dir / fragment_filename
     
-    # Create a temporary JSON file with the data
-    temp_json = ldes_dir / f"temp_{fragment_timestamp}.json"
-    with open(temp_json, 'w') as f:
-        json.dump(ldes_data, f)
+    # Set default values if not provided
+    if ldes_timestampPath_property is None:
+        ldes_timestampPath_property = 'dc:modified'
+    if ldes_versionOfPath_property is None:
+        ldes_versionOfPath_property = 'dc:isVersionOf'
+    
+    # Prepare variables for template
+    vars_dict = {
+        'source_id': source_id,
+        'fragment_timestamp': fragment_timestamp,
+        'prev_fragment_timestamp': prev_fragment_timestamp,
+        'prev_fragment_time': prev_fragment_time,
+        'prefix_uri': prefix_uri,
+        'has_previous': prev_fragment_timestamp is not None,
+        'types': types if types else [],
+        'ldes_timestampPath_property': ldes_timestampPath_property,
+        'ldes_versionOfPath_property': ldes_versionOfPath_property,
+    }
     
-    try:
-        # Set default values if not provided
-        if ldes_timestampPath_property is None:
-            ldes_timestampPath_property = 'dc:modified'
-        if ldes_versionOfPath_property is None:
-            ldes_versionOfPath_property = 'dc:isVersionOf'
-        
-        # Prepare variables for template
-        vars_dict = {
-            'source_id': source_id,
-            'fragment_timestamp': fragment_timestamp,
-            'prev_fragment_timestamp': prev_fragment_timestamp,
-            'prev_fragment_time': prev_fragment_time,
-            'prefix_uri': prefix_uri,
-            'has_previous': prev_fragment_timestamp is not None,
-            'types': types if types else [],
-            'ldes_timestampPath_property': ldes_timestampPath_property,
-            'ldes_versionOfPath_property': ldes_versionOfPath_property,
-        }
-        
-        # Get templates folder
-        templates_folder = Path(__file__).parent / "ldes_templates"
-        
-        # Create generator and sink
-        service = JinjaBasedGenerator(str(templates_folder))
-        sink = SinkFactory.make_sink(str(output_file), False)
-        inputs = {'qres': SourceFactory.make_source(str(temp_json))}
-        settings = GeneratorSettings()
-        settings.iteration = False  # Use collection mode for full fragment generation
-        
-        # Generate the fragment
-        service.process("ldes_fragment.ttl", inputs, settings, sink, vars_dict)
-        
-        print(f"Generated LDES fragment: {output_file}")
-        
-        return output_file
-        
-    finally:
-        # Clean up temp file
-        if temp_json.exists():
-            temp_json.unlink()
+    # Render the whole fragment in one go (collection mode), with the data
+    # passed in memory as the 'qres' set
+    render = get_fragment_renderer(LDES_FRAGMENT_TEMPLATE)
+    fragment = render(sets={'qres': ldes_data}, **vars_dict)
+    
+    # Exclusive create: an existing fragment is never overwritten
+    with open(output_file, 'x', encoding='utf-8') as f:
+        f.write(fragment)
+    
+    logger.info("Generated LDES fragment: %s", output_file)
+    
+    return output_file
 
 
 def update_latest_symlink(source_id, fragment_file):
     """
-    Copy the newest fragment to latest.ttl.
+    Point latest.ttl at the newest fragment.
+
+    latest.ttl is made a hard link to the fragment (fragments are never
+    rewritten, so sharing the file is safe) and swapped in with an atomic
+    rename, so readers never see a partially written latest.ttl.
     
     Args:
         source_id: Source identifier
@@ -555,11 +890,17 @@ def update_latest_symlink(source_id, fragment_file):
     """
     ldes_dir = get_ldes_directory(source_id)
     latest_file = ldes_dir / "latest.ttl"
+    tmp_file = ldes_dir / "latest.ttl.tmp"
     
-    # Copy the content
-    shutil.copy2(fragment_file, latest_file)
+    tmp_file.unlink(missing_ok=True)
+    try:
+        os.link(fragment_file, tmp_file)
+    except OSError:
+        # Hard links not supported here: fall back to copying the content
+        shutil.copy2(fragment_file, tmp_file)
+    os.replace(tmp_file, latest_file)
     
-    print(f"Updated latest.ttl -> {fragment_file.name}")
+    logger.info("Updated latest.ttl -> %s", fragment_file.name)
 
 
 def update_translations_to_merged(db_path, translation_ids):
@@ -576,7 +917,7 @@ def update_translations_to_merged(db_path, translation_ids):
     if not translation_ids:
         return 0
     
-    conn = sqlite3.connect(db_path)
+    conn = get_connection(db_path)
     cursor = conn.cursor()
     
     try:
@@ -594,15 +935,15 @@ def update_translations_to_merged(db_path, translation_ids):
         updated_count = cursor.rowcount
         conn.commit()
         
-        print(f"Updated {updated_count} translation(s) to 'merged' status")
+        logger.info("Updated %s translation(s) to 'merged' status", updated_count)
         return updated_count
         
     except Exception as e:
         conn.rollback()
-        print(f"Error updating translations to merged: {e}")
+        logger.error("Error updating translations to merged: %s", e)
         raise
     finally:
-        conn.close()
+        cursor.close()
 
 
 def create_or_update_ldes(source_id, db_path, prefix_uri="https://this_should_be_filled_in.com"):
@@ -622,79 +963,72 @@ def create_or_update_ldes(source_id, db_path, prefix_uri="https://this_should_be
     Returns:
         dict: Result with status and message
     """
-    print(f"Processing LDES for source {source_id}")
-    print(f"Database: {db_path}")
-    print(f"Prefix URI: {prefix_uri}")
-    
-    # Step 1: Detect existing LDES feed
-    # Always query all translations with status='approved' (no date filtering in query)
+    logger.info("Processing LDES for source %s", source_id)
+    logger.info("Database: %s", db_path)
+    logger.info("Prefix URI: %s", prefix_uri)
+    
+    # Step 1: Stream all translations with status='approved' (no date filtering in query).
+    # Pulling the first record is the "anything to do?" probe: in the common
+    # no-op refresh the query comes back empty and we stop before touching
+    # the LDES directory
     translations = query_translations_for_ldes(db_path, source_id)
+    first_translation = next(translations, None)
     
-    if not translations:
-        print("No translations with status='approved' found.")
+    if first_translation is None:
+        logger.info("No translations with status='approved' found.")
         return {
             'status': 'skipped',
             'message': 'No translations with status=approved found',
             'fragment': None
         }
-        
-    print(f"Found {len(translations)} approved translation(s) in database")
     
     # Get previous fragment info to ensure monotonic order and adjust older timestamps
     prev_fragment_timestamp, prev_fragment_datetime = get_previous_fragment(source_id)
     
-    if prev_fragment_datetime:
-        prev_naive = prev_fragment_datetime.replace(tzinfo=None) if prev_fragment_datetime.tzinfo else prev_fragment_datetime
-        for t in translations:
-            t_dt = parse_datetime(t['event_at'])
-            t_naive = t_dt.replace(tzinfo=None) if t_dt.tzinfo else t_dt
-            if t_naive <= prev_naive:
-                # Adjust event_at to be slightly newer than the previous fragment
-                adjusted_dt = prev_naive + timedelta(seconds=1)
-                t['event_at'] = adjusted_dt.strftime("%Y-%m-%d %H:%M:%S")
-                # Also adjust updated_at, modified_at, created_at to avoid mismatches
-                t['updated_at'] = t['event_at']
-    
-    print(f"Found {len(translations)} translation(s) for LDES")
+    # Adjust, group and collect the records in a single pass
+    translations = adjust_event_times(
+        chain([first_translation], translations), prev_fragment_datetime
+    )
     
     # Step 5: Prepare LDES data
-    ldes_data = prepare_ldes_data(translations)
+    ldes_data, translation_ids, latest_event_at = prepare_ldes_data(translations)
+        
+    logger.info("Found %s translation(s) for LDES", len(translation_ids))
     
     # Determine fragment timestamp based on latest modified date in translations
-    # Use epoch timestamp for fragment naming
-    if translations:
-        latest_trans_date = max(
-            parse_datetime(t['event_at']) for t in translations
-        )
-        # Convert to epoch timestamp (seconds since 1970-01-01)
-        epoch_timestamp = int(latest_trans_date.timestamp())
-        fragment_timestamp = str(epoch_timestamp)
-    else:
-        now = datetime.now()
-        epoch_timestamp = int(now.timestamp())
-        fragment_timestamp = str(epoch_timestamp)
-    
-    # Step 5b: Get previous fragment information for tree:relation
-    prev_fragment_timestamp, prev_fragment_datetime = get_previous_fragment(source_id)
-    
+    # Use epoch timestamp for fragment naming. SQLite returns the rows ordered
+    # by event timestamp, and the adjustment only raises older timestamps to
+    # the same value, so the last row carries the latest event
+    latest_trans_date = parse_datetime(latest_event_at)
+    # Convert to epoch timestamp (seconds since 1970-01-01)
+    epoch_timestamp = int(latest_trans_date.timestamp())
+    fragment_timestamp = str(epoch_timestamp)
+    
+    # Step 5b: Reuse the previous fragment information for tree:relation
     if prev_fragment_timestamp and prev_fragment_datetime:
         # Format the previous fragment datetime for tree:value
         prev_fragment_time = prev_fragment_datetime.strftime("%Y-%m-%dT%H:%M:%SZ")
-        print(f"Previous fragment found: {prev_fragment_timestamp} ({prev_fragment_time})")
+        logger.info("Previous fragment found: %s (%s)", prev_fragment_timestamp, prev_fragment_time)
     else:
         prev_fragment_time = None
-        print("No previous fragment found. This is the first fragment.")
+        logger.info("No previous fragment found. This is the first fragment.")
     
-    # Step 5c: Extract types from source translation_config
-    types = extract_types_from_source(db_path, source_id)
+    # Step 5c: Extract types from source translation_config; the source row
+    # is read once and shared with the LDES path lookup below
+    try:
+        source = query_source(db_path, source_id)
+    except sqlite3.Error as e:
+        logger.error("Error reading source %s: %s", source_id, e)
+        source = None
+    types = extract_types_from_source(source_id, source)
     
-    print(f"Types extracted for LDES: {types}")
+    logger.info("Types extracted for LDES: %s", types)
     
     # Step 5d: Extract LDES paths (timestampPath and versionOfPath) from source
-    ldes_timestampPath_property, ldes_versionOfPath_property = extract_ldes_paths_from_source(db_path, source_id)
+    ldes_timestampPath_property, ldes_versionOfPath_property = extract_ldes_paths_from_source(db_path, source_id, source)
     
-    print(f"LDES timestampPath property: {ldes_timestampPath_property}")
-    print(f"LDES versionOfPath property: {ldes_versionOfPath_property}")
+    logger.info("LDES timestampPath property: %s", ldes_timestampPath_property)
+    logger.info("LDES versionOfPath property: %s", ldes_versionOfPath_property)
     
     # Step 6: Generate LDES fragment
     fragment_file = generate_ldes_fragment(
@@ -713,23 +1047,75 @@ def create_or_update_ldes(source_id, db_path, prefix_uri="https://this_should_be
     update_latest_symlink(source_id, fragment_file)
     
     # Step 8: Update translation statuses to 'merged' after successful fragment creation
-    translation_ids = [t['translation_id'] for t in translations]
     updated_count = update_translations_to_merged(db_path, translation_ids)
     
     return {
         'status': 'success',
         'message': f'LDES fragment created successfully',
         'fragment': str(fragment_file),
-        'translations_count': len(translations),
+        'translations_count': len(translation_ids),
         'merged_count': updated_count
     }
 
 
+def create_or_update_ldes_many(source_ids, db_path, prefix_uri="https://this_should_be_filled_in.com", max_workers=None):
+    """
+    Create or update the LDES feeds of several sources in parallel.
+
+    Each source runs create_or_update_ldes in its own worker process with its
+    own SQLite connections; sources write to separate LDES directories, so no
+    coordination is needed beyond SQLite's own locking for the status update.
+
+    Args:
+        source_ids: Iterable of source identifiers
+        db_path: Path to SQLite database
+        prefix_uri: Base URI prefix for LDES
+        max_workers: Maximum number of worker processes (default: CPU count)
+
+    Returns:
+        dict: Result of create_or_update_ldes per source ID; a source whose
+        worker raised gets an 'error' result instead
+    """
+    source_ids = list(source_ids)
+    results = {}
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            source_id: executor.submit(create_or_update_ldes, source_id, db_path, prefix_uri)
+            for source_id in source_ids
+        }
+        for source_id, future in futures.items():
+            try:
+                results[source_id] = future.result()
+            except Exception as e:
+                logger.error("Error during LDES generation for source %s: %s", source_id, e)
+                results[source_id] = {
+                    'status': 'error',
+                    'message': str(e),
+                    'fragment': None
+                }
+
+    return results
+
+
 def main():
     """Main execution function."""
+    # Log plain messages: progress to stdout, warnings and errors (with their
+    # tracebacks) to stderr, which the task dispatcher reports as the cause of
+    # a failed run
+    stdout_handler = logging.StreamHandler(sys.stdout)
+    stdout_handler.addFilter(lambda record: record.levelno < logging.WARNING)
+    stderr_handler = logging.StreamHandler(sys.stderr)
+    stderr_handler.setLevel(logging.WARNING)
+    logging.basicConfig(
+        level=os.environ.get("LOG_LEVEL", "INFO").upper(),
+        format="%(message)s",
+        handlers=[stdout_handler, stderr_handler]
+    )
+
     if len(sys.argv) < 3:
-        print("Error: Source ID and database path are required")
-        print("Usage: python ldes.py <source-id> <database-path> [prefix-uri]")
+        logger.error("Error: Source ID and database path are required")
+        logger.error("Usage: python ldes.py <source-id> <database-path> [prefix-uri]")
         sys.exit(1)
     
     source_id = sys.argv[1]
@@ -738,26 +1124,24 @@ def main():
     
     # Validate inputs
     if not os.path.exists(db_path):
-        print(f"Error: Database file not found: {db_path}")
+        logger.error("Error: Database file not found: %s", db_path)
         sys.exit(1)
     
     try:
         result = create_or_update_ldes(source_id, db_path, prefix_uri)
-        print(f"\nResult: {result['status']}")
-        print(f"Message: {result['message']}")
+        logger.info("\nResult: %s", result['status'])
+        logger.info("Message: %s", result['message'])
         
         if result.get('fragment'):
-            print(f"Fragment: {result['fragment']}")
+            logger.info("Fragment: %s", result['fragment'])
         if result.get('translations_count'):
-            print(f"Translations processed: {result['translations_count']}")
+            logger.info("Translations processed: %s", result['translations_count'])
         
         # Return appropriate exit code
         sys.exit(0 if result['status'] in ['success', 'skipped'] else 1)
         
     except Exception as e:
-        print(f"Error during LDES generation: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error during LDES generation: %s", e)
         sys.exit(1)
 
 
@@ -0,0 +1,132 @@
+# backend/tests/test_scan_ldes_paths.py
+import os
+import sys
+
+from rdflib import Graph, Namespace
+
+# Adjust path to find backend/src/services
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src/services')))
+
+import ldes
+
+LDES = Namespace(ldes.LDES_NAMESPACE)
+BASE = "http://example.com/feed"
+
+PREFIXES = """
+@prefix ldes: <https://w3id.org/ldes#> .
+@prefix dcterms: <http://purl.org/dc/terms/> .
+@prefix prov: <http://www.w3.org/ns/prov#> .
+"""
+
+EX_PREFIXES = """
+@prefix ldes: <https://w3id.org/ldes#> .
+@prefix ex: <http://ex.org/> .
+"""
+
+# (name, document, expected outcome of the regex scan: "scan" when it must
+# resolve the paths itself, "fallback" when it must leave them to rdflib)
+CASES = [
+    ("prefixed names", PREFIXES + """
+<feed> a ldes:EventStream ;
+    ldes:timestampPath dcterms:modified ;
+    ldes:versionOfPath dcterms:isVersionOf .
+""", "scan"),
+    ("prefixed name split over lines", PREFIXES + """
+<feed> ldes:timestampPath
+        prov:generatedAtTime.
+""", "scan"),
+    ("full IRIs", """
+<http://example.com/feed> <https://w3id.org/ldes#timestampPath> <http://www.w3.org/ns/prov#generatedAtTime> ;
+    <https://w3id.org/ldes#versionOfPath> <http://purl.org/dc/terms/isVersionOf> .
+""", "scan"),
+    ("SPARQL-style PREFIX", """
+PREFIX l: <https://w3id.org/ldes#>
+PREFIX : <http://example.com/ns#>
+<http://example.com/feed> l:timestampPath :ts ; l:versionOfPath :version .
+""", "scan"),
+    ("no paths declared", PREFIXES + """
+<feed> a ldes:EventStream .
+""", "scan"),
+    ("relative IRI", PREFIXES + """
+<feed> ldes:timestampPath <modified> .
+""", "fallback"),
+    ("path in a comment", PREFIXES + """
+# ldes:timestampPath <http://wrong/>
+<feed> ldes:timestampPath <http://right/> .
+""", "fallback"),
+    ("path in a string literal", PREFIXES + """
+<feed> dcterms:description "ldes:timestampPath <http://wrong/>" ;
+    ldes:timestampPath <http://right/> .
+""", "fallback"),
+    ("path in a multi-line literal", PREFIXES + '''
+<feed> dcterms:description """
+ldes:timestampPath <http://wrong/>
+""" ;
+    ldes:timestampPath <http://right/> .
+''', "fallback"),
+    ("path stated twice", PREFIXES + """
+<feed> ldes:timestampPath <http://one/> .
+<other> ldes:timestampPath <http://two/> .
+""", "fallback"),
+    ("prefix bound to another namespace", """
+@prefix ldes: <http://example.com/not-ldes#> .
+<http://example.com/feed> ldes:timestampPath <http://wrong/> .
+""", "fallback"),
+    ("colon in local name", EX_PREFIXES + """
+<feed> ldes:timestampPath ex:a:b .
+""", "fallback"),
+    ("escaped local name", EX_PREFIXES + """
+<feed> ldes:timestampPath ex:mod\\-ified .
+""", "fallback"),
+    ("percent-encoded local name", EX_PREFIXES + """
+<feed> ldes:timestampPath ex:x%41y .
+""", "fallback"),
+    ("escape in a full IRI", PREFIXES + """
+<feed> ldes:timestampPath <http://ex/\\u0041b> .
+""", "fallback"),
+    ("escape in a prefix namespace", """
+@prefix ldes: <https://w3id.org/ldes#> .
+@prefix ex: <http://ex/\\u0041#> .
+<feed> ldes:timestampPath ex:ts .
+""", "fallback"),
+    ("relative prefix namespace", """
+@prefix ldes: <https://w3id.org/ldes#> .
+@prefix ex: <rel/> .
+<feed> ldes:timestampPath ex:ts .
+""", "fallback"),
+    ("path as subject", EX_PREFIXES + """
+ldes:timestampPath ex:label "x" .
+""", "fallback"),
+    ("path as object", EX_PREFIXES + """
+<feed> ex:label ldes:timestampPath .
+""", "fallback"),
+]
+
+
+def parse_ldes_paths(ttl_content):
+    g = Graph()
+    g.parse(data=ttl_content, format="turtle", publicID=BASE)
+    timestamp_path = next((str(o) for _, _, o in g.triples((None, LDES.timestampPath, None))), None)
+    versionof_path = next((str(o) for _, _, o in g.triples((None, LDES.versionOfPath, None))), None)
+    return timestamp_path, versionof_path
+
+
+def test_scan_ldes_paths():
+    for name, ttl_content, expected in CASES:
+        scanned = ldes.scan_ldes_paths(ttl_content)
+        parsed = parse_ldes_paths(ttl_content)
+        print(f"{name}: scan={scanned} rdflib={parsed}")
+
+        if expected == "fallback":
+            assert scanned is None, f"{name}: expected a fallback to rdflib, got {scanned}"
+        else:
+            assert scanned == parsed, f"{name}: scan returned {scanned}, rdflib {parsed}"
+
+    print("✓ scan_ldes_paths agrees with rdflib or falls back to it.")
+
+if __name__ == "__main__":
+    try:
+        test_scan_ldes_paths()
+    except Exception as e:
+        print("Test failed:", e)
+        sys.exit(1)